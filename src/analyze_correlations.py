@@ -10,17 +10,19 @@ This script is NOT part of the automated pipeline; run it manually once after
 all batches have been ingested and validated.
 
 Usage:
-    python src/analyze_correlations.py [--target meantemp]
+    python src/analyze_correlations.py [--target meantemp] [--full-matrix]
 """
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from utils import CSV_ENGINE, write_json
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -38,6 +40,10 @@ def main() -> None:
         "--target", default="meantemp",
         help="Target variable for feature-target correlation (default: meantemp)",
     )
+    parser.add_argument(
+        "--full-matrix", action="store_true",
+        help="Include the dense feature-feature correlation matrix in the report",
+    )
     args = parser.parse_args()
 
     project_root = Path(__file__).resolve().parent.parent
@@ -47,7 +53,8 @@ def main() -> None:
         logger.error("Run validate.py first.")
         sys.exit(1)
 
-    df = pd.read_csv(silver_path)
+    # No parse_dates: only numeric columns are analysed, so date can stay as read
+    df = pd.read_csv(silver_path, engine=CSV_ENGINE)
     logger.info("Loaded %d rows, %d columns from %s", len(df), len(df.columns), silver_path)
 
     numeric_df = df.select_dtypes(include="number")
@@ -57,17 +64,31 @@ def main() -> None:
 
     logger.info("Numeric columns: %s", list(numeric_df.columns))
 
-    corr_matrix = numeric_df.corr(method="pearson")
-    logger.info("Feature-feature correlation matrix:\n%s", corr_matrix.to_string())
+    # Pearson matrix as one GEMM over standardized complete rows
+    # (Silver is imputed, so dropna drops nothing)
+    arr = numeric_df.dropna().to_numpy(dtype=np.float64)
+    z = (arr - arr.mean(axis=0)) / arr.std(axis=0)
+    corr_matrix = pd.DataFrame(
+        np.clip(z.T @ z / len(z), -1.0, 1.0),
+        index=numeric_df.columns,
+        columns=numeric_df.columns,
+    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Feature-feature correlation matrix:\n%s", corr_matrix.to_string())
 
     # Identify highly correlated pairs (|r| > 0.9, excluding self-correlations)
-    high_corr_pairs = []
     cols = corr_matrix.columns.tolist()
-    for i, c1 in enumerate(cols):
-        for c2 in cols[i + 1:]:
-            r = corr_matrix.loc[c1, c2]
-            if abs(r) > 0.9:
-                high_corr_pairs.append({"feature_1": c1, "feature_2": c2, "r": round(r, 4)})
+    corr_values = corr_matrix.to_numpy()
+    iu, ju = np.nonzero(np.abs(np.triu(corr_values, k=1)) > 0.9)
+    col_names = corr_matrix.columns.to_numpy()
+    high_corr_pairs = [
+        {"feature_1": c1, "feature_2": c2, "r": r}
+        for c1, c2, r in zip(
+            col_names[iu].tolist(),
+            col_names[ju].tolist(),
+            np.round(corr_values[iu, ju], 4).tolist(),
+        )
+    ]
 
     if high_corr_pairs:
         logger.warning("Highly correlated pairs (|r| > 0.9):")
@@ -80,10 +101,9 @@ def main() -> None:
     target = args.target
     target_corr = {}
     if target in numeric_df.columns:
-        for col in numeric_df.columns:
-            if col != target:
-                r = numeric_df[target].corr(numeric_df[col])
-                target_corr[col] = round(r, 4)
+        # Row of the full matrix already holds every feature-target r
+        target_row = corr_matrix[target].drop(target)
+        target_corr = dict(zip(target_row.index, np.round(target_row.to_numpy(), 4).tolist()))
         logger.info("Feature-target correlations (target=%s):", target)
         for col, r in sorted(target_corr.items(), key=lambda x: abs(x[1]), reverse=True):
             logger.info("  %s : r=%.4f", col, r)
@@ -93,18 +113,17 @@ def main() -> None:
     report = {
         "target": target,
         "numeric_columns": list(numeric_df.columns),
-        "correlation_matrix": {
-            c1: {c2: round(corr_matrix.loc[c1, c2], 4) for c2 in cols}
-            for c1 in cols
-        },
-        "high_correlation_pairs": high_corr_pairs,
-        "feature_target_correlations": target_corr,
     }
+    if args.full_matrix:
+        report["correlation_matrix"] = {
+            c1: dict(zip(cols, row)) for c1, row in zip(cols, np.round(corr_values, 4).tolist())
+        }
+    report["high_correlation_pairs"] = high_corr_pairs
+    report["feature_target_correlations"] = target_corr
 
     report_path = project_root / REPORT_PATH
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=2)
+    write_json(report_path, report)
     logger.info("Wrote correlation report to %s", report_path)
 
     logger.info(
@@ -5,17 +5,22 @@ Idempotent: skips batches already recorded in ingested_batches.json.
 """
 
 import json
-import re
 from pathlib import Path
 
+import yaml
+
+from utils import write_json
+
+COPY_CHUNK_SIZE = 1 << 20
+
 
 def _read_batch_id(params_path: Path) -> int:
-    """Read batch_id from params.yaml (simple key: value parsing)."""
+    """Read batch_id from params.yaml."""
     text = params_path.read_text()
-    m = re.search(r"batch_id\s*:\s*(\d+)", text)
-    if not m:
+    params = yaml.safe_load(text) or {}
+    if not isinstance(params, dict) or "batch_id" not in params:
         raise ValueError(f"batch_id not found in {params_path}")
-    return int(m.group(1))
+    return int(params["batch_id"])
 
 
 def main() -> None:
@@ -45,30 +50,31 @@ def main() -> None:
     if not batch_path.exists():
         raise FileNotFoundError(f"Batch file not found: {batch_path}")
 
-    with open(batch_path) as f:
-        lines = f.readlines()
-    if not lines:
-        print(f"[INGEST] Batch {batch_id} is empty. Nothing to append.")
-        ingested.append(batch_id)
-        with open(ingested_log_path, "w") as f:
-            json.dump(ingested, f, indent=2)
-        return
-
-    header = lines[0]
-    data_lines = lines[1:]
-    row_count = len(data_lines)
-
-    # 4. Append to bronze (create if not exists)
+    # 4. Append to bronze (create if not exists), streaming bytes past the header
     write_header = not bronze_path.exists()
-    with open(bronze_path, "a") as f:
-        if write_header:
-            f.write(header)
-        f.writelines(data_lines)
+    with open(batch_path, "rb") as src:
+        header = src.readline()
+        if not header:
+            print(f"[INGEST] Batch {batch_id} is empty. Nothing to append.")
+            ingested.append(batch_id)
+            write_json(ingested_log_path, ingested)
+            return
+        with open(bronze_path, "ab") as dst:
+            if write_header:
+                dst.write(header)
+            row_count = 0
+            last_chunk = b""
+            while chunk := src.read(COPY_CHUNK_SIZE):
+                dst.write(chunk)
+                row_count += chunk.count(b"\n")
+                last_chunk = chunk
+            # A final row without a trailing newline still counts
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                row_count += 1
 
     # 5. Update ingestion log
     ingested.append(batch_id)
-    with open(ingested_log_path, "w") as f:
-        json.dump(ingested, f, indent=2)
+    write_json(ingested_log_path, ingested)
 
     print(f"[INGEST] Ingested batch {batch_id}: {row_count} rows appended to bronze.csv")
     if write_header:
@@ -8,13 +8,14 @@ No scaling or train/test splitting is applied — those are deferred to the
 ModelOps stage.
 """
 
-import json
 import logging
-import re
 import sys
 from pathlib import Path
 
 import pandas as pd
+import yaml
+
+from utils import CSV_ENGINE, write_json
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,17 +32,13 @@ GOLD_REPORT_PATH = Path("data/gold/gold_report.json")
 TARGET_SOURCE_COL = "meantemp"
 TARGET_COL = "target"
 
-
 def load_features_config(path: Path) -> list[str]:
-    """Parse selected features list from a simple YAML config."""
+    """Parse the selected features list from the YAML config."""
     text = path.read_text()
+    config = yaml.safe_load(text) or {}
     features: list[str] = []
-    for line in text.splitlines():
-        m = re.match(r"^\s+-\s+(.+)$", line)
-        if m:
-            value = m.group(1).strip()
-            if not value.startswith("#"):
-                features.append(value)
+    if isinstance(config, dict):
+        features = [str(f) for f in config.get("features") or []]
     if not features:
         raise ValueError(f"No features found in {path}")
     return features
@@ -49,6 +46,7 @@ def load_features_config(path: Path) -> list[str]:
 
 def select_features(df: pd.DataFrame, features: list[str]) -> pd.DataFrame:
     """Keep only the columns listed in the config. Fail on missing columns."""
+    feature_set = set(features)
     available = set(df.columns)
     missing = [f for f in features if f not in available]
     if missing:
@@ -56,7 +54,7 @@ def select_features(df: pd.DataFrame, features: list[str]) -> pd.DataFrame:
             f"Features in config but missing from data: {missing}. "
             f"Available columns: {sorted(available)}"
         )
-    extra = sorted(available - set(features))
+    extra = sorted(available - feature_set)
     if extra:
         logger.info("Dropping columns not in config: %s", extra)
     return df[features]
@@ -105,8 +103,8 @@ def build_report(df: pd.DataFrame) -> dict:
         "feature_columns": [c for c in df.columns if c not in ("date", TARGET_COL)],
         "target_column": TARGET_COL,
         "date_range": [
-            str(df["date"].min()),
-            str(df["date"].max()),
+            df["date"].min().strftime("%Y-%m-%d"),
+            df["date"].max().strftime("%Y-%m-%d"),
         ],
         "target_stats": {
             "mean": round(float(df[TARGET_COL].mean()), 4),
@@ -132,7 +130,7 @@ def main() -> None:
         sys.exit(1)
 
     logger.info("Loading Silver data from %s", silver_path)
-    df = pd.read_csv(silver_path)
+    df = pd.read_csv(silver_path, engine=CSV_ENGINE, parse_dates=["date"])
     rows_in = len(df)
     logger.info("Loaded %d rows, %d columns", rows_in, len(df.columns))
 
@@ -153,8 +151,7 @@ def main() -> None:
     logger.info("Wrote Gold dataset to %s (%d rows)", gold_path, len(df))
 
     report_path = project_root / GOLD_REPORT_PATH
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=2)
+    write_json(report_path, report)
     logger.info("Wrote Gold report to %s", report_path)
 
 
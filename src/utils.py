@@ -0,0 +1,15 @@
+"""Shared helpers for the pipeline scripts."""
+
+from pathlib import Path
+
+import orjson
+
+# Parse layer CSVs with pyarrow's multithreaded reader (a hard requirement).
+# Pinned rather than chosen by what is installed: pandas' C parser rounds some
+# values 1 ULP differently, which would make the DVC outputs environment-dependent.
+CSV_ENGINE = "pyarrow"
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj to path as JSON indented by 2 spaces (NumPy scalars/arrays allowed)."""
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
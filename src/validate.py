@@ -6,13 +6,16 @@ Reads bronze data, validates, cleans, adds derived features, and outputs
 silver data with a validation report.
 """
 
-import json
 import logging
 import sys
 from pathlib import Path
 
+import bottleneck as bn
+import numpy as np
 import pandas as pd
 
+from utils import CSV_ENGINE, write_json
+
 # Configure logging for deterministic, readable output
 logging.basicConfig(
     level=logging.INFO,
@@ -56,10 +59,14 @@ def detect_date_column(df: pd.DataFrame) -> str:
 def load_bronze(path: Path) -> pd.DataFrame:
     """Load bronze CSV and parse date column."""
     logger.info("Loading bronze data from %s", path)
-    df = pd.read_csv(path)
-    date_col = detect_date_column(df)
+    header = pd.read_csv(path, nrows=0)
+    date_col = detect_date_column(header)
     logger.info("Detected date column: %s", date_col)
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    dtypes = {c: "float64" for c in VALUE_RANGES if c in header.columns}
+    df = pd.read_csv(path, engine=CSV_ENGINE, parse_dates=[date_col], dtype=dtypes)
+    # parse_dates leaves the column unparsed if any value is malformed
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
     invalid_dates = df[date_col].isna().sum()
     if invalid_dates > 0:
         logger.error("Found %d invalid date values", invalid_dates)
@@ -67,6 +74,15 @@ def load_bronze(path: Path) -> pd.DataFrame:
     return df, date_col
 
 
+def _range_masks(block: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Return (below_min, above_max) masks of shape (rows, cols) for VALUE_RANGES columns."""
+    values = block.to_numpy(dtype=np.float64)
+    lows = np.array([VALUE_RANGES[c][0] for c in block.columns], dtype=np.float64)
+    highs = np.array([VALUE_RANGES[c][1] for c in block.columns], dtype=np.float64)
+    # NaN compares False on both sides, so missing values are never flagged
+    return values < lows, values > highs
+
+
 def run_checks(df: pd.DataFrame, date_col: str, report: dict) -> bool:
     """Run validation checks. Returns False if hard-fail occurred."""
     all_ok = True
@@ -88,8 +104,11 @@ def run_checks(df: pd.DataFrame, date_col: str, report: dict) -> bool:
     min_date = df_sorted[date_col].min()
     max_date = df_sorted[date_col].max()
     full_range = pd.date_range(start=min_date, end=max_date, freq="D")
-    existing_dates = set(df_sorted[date_col].dt.normalize())
-    missing_dates = [d for d in full_range if d.normalize() not in existing_dates]
+    # Compare at day resolution in NumPy instead of normalizing each Timestamp
+    existing_days = df_sorted[date_col].to_numpy().astype("datetime64[D]")
+    expected_days = full_range.to_numpy().astype("datetime64[D]")
+    missing_days = np.setdiff1d(expected_days, existing_days)
+    missing_dates = np.datetime_as_string(missing_days, unit="D").tolist()
     n_missing = len(missing_dates)
     if n_missing > 0:
         logger.warning("Found %d missing dates between %s and %s", n_missing, min_date, max_date)
@@ -98,7 +117,7 @@ def run_checks(df: pd.DataFrame, date_col: str, report: dict) -> bool:
         else:
             logger.warning("First 10: %s ... last 10: %s", missing_dates[:10], missing_dates[-10:])
         report["missing_dates"] = n_missing
-        report["missing_date_list"] = [d.strftime("%Y-%m-%d") for d in missing_dates]
+        report["missing_date_list"] = missing_dates
     else:
         report["missing_dates"] = 0
         report["missing_date_list"] = []
@@ -108,13 +127,15 @@ def run_checks(df: pd.DataFrame, date_col: str, report: dict) -> bool:
     report["value_range_violations"] = {}
     report["value_range_warnings"] = {}
 
-    for col in numeric_cols:
+    block = df[numeric_cols]
+    non_numeric = [c for c in numeric_cols if not pd.api.types.is_numeric_dtype(block[c])]
+    if non_numeric:
+        block = block.assign(**{c: pd.to_numeric(block[c], errors="coerce") for c in non_numeric})
+    below, above = _range_masks(block)
+    counts = zip(numeric_cols, below.sum(axis=0).tolist(), above.sum(axis=0).tolist())
+
+    for col, n_low, n_high in counts:
         min_val, max_val, hard_fail = VALUE_RANGES[col]
-        series = pd.to_numeric(df[col], errors="coerce")
-        low = (series < min_val) & series.notna()
-        high = (series > max_val) & series.notna()
-        n_low = low.sum()
-        n_high = high.sum()
         if n_low > 0 or n_high > 0:
             if hard_fail:
                 logger.error(
@@ -143,6 +164,18 @@ def run_checks(df: pd.DataFrame, date_col: str, report: dict) -> bool:
     return all_ok
 
 
+def _ffill_bfill(values: np.ndarray) -> np.ndarray:
+    """Column-wise ffill().bfill() of a 2D float array in a single gather."""
+    missing = np.isnan(values)
+    rows = np.arange(len(values))[:, None]
+    # Index of the most recent valid row at or above each cell; 0 before the first one
+    src = np.maximum.accumulate(np.where(missing, 0, rows), axis=0)
+    # Leading gaps take the first valid row instead (the bfill step)
+    first_valid = np.argmax(~missing, axis=0)
+    src = np.where(rows < first_valid, first_valid, src)
+    return np.take_along_axis(values, src, axis=0)
+
+
 def clean_data(df: pd.DataFrame, date_col: str, report: dict) -> pd.DataFrame:
     """Apply cleaning: drop duplicates, fill missing dates, impute missing values."""
     rows_in = len(df)
@@ -175,16 +208,18 @@ def clean_data(df: pd.DataFrame, date_col: str, report: dict) -> pd.DataFrame:
     # Replace soft-fail out-of-range values with NaN (to be imputed below)
     numeric_cols = [c for c in df.columns if c != date_col]
     report["soft_range_replacements"] = {}
-    for col in numeric_cols:
-        if col in VALUE_RANGES:
-            min_val, max_val, hard_fail = VALUE_RANGES[col]
-            if not hard_fail:
-                mask = (df[col] < min_val) | (df[col] > max_val)
-                n_replaced = mask.sum()
-                if n_replaced > 0:
-                    df.loc[mask, col] = float("nan")
-                    report["soft_range_replacements"][col] = int(n_replaced)
-                    logger.info("Replaced %d out-of-range values in %s with NaN", n_replaced, col)
+    soft_cols = [c for c in numeric_cols if c in VALUE_RANGES and not VALUE_RANGES[c][2]]
+    if soft_cols:
+        below, above = _range_masks(df[soft_cols])
+        out_of_range = below | above
+        if out_of_range.any():
+            values = df[soft_cols].to_numpy(dtype=np.float64, copy=True)
+            values[out_of_range] = np.nan
+            df[soft_cols] = values
+        for col, n_replaced in zip(soft_cols, out_of_range.sum(axis=0).tolist()):
+            if n_replaced > 0:
+                report["soft_range_replacements"][col] = n_replaced
+                logger.info("Replaced %d out-of-range values in %s with NaN", n_replaced, col)
 
     # Impute missing numeric values: forward-fill then backward-fill
     missing_before = {}
@@ -196,7 +231,8 @@ def clean_data(df: pd.DataFrame, date_col: str, report: dict) -> pd.DataFrame:
     if missing_before:
         report["missing_values_before_impute"] = missing_before
         total_missing = sum(missing_before.values())
-        df[numeric_cols] = df[numeric_cols].ffill().bfill()
+        gap_cols = list(missing_before)
+        df[gap_cols] = _ffill_bfill(df[gap_cols].to_numpy(dtype=np.float64))
         report["missing_values_imputed"] = int(total_missing)
         logger.info("Imputed %d missing numeric values (ffill then bfill)", total_missing)
     else:
@@ -221,30 +257,41 @@ def clean_data(df: pd.DataFrame, date_col: str, report: dict) -> pd.DataFrame:
     return df
 
 
+def _lag_bfilled(values: np.ndarray, k: int) -> np.ndarray:
+    """Shift values down by k rows and back-fill the leading gap (shift(k).bfill())."""
+    lagged = np.full_like(values, np.nan)
+    if len(values) > k:
+        lagged[k:] = values[:-k]
+        lagged[:k] = values[0]
+    return lagged
+
+
 def add_derived_features(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
     """Create weather-derived features from the cleaned Silver data."""
     df = df.sort_values(date_col).reset_index(drop=True)
 
-    df["meantemp_rolling_7d"] = df["meantemp"].rolling(window=7, min_periods=1).mean()
-    df["meantemp_lag_1"] = df["meantemp"].shift(1)
-    df["meantemp_lag_7"] = df["meantemp"].shift(7)
+    meantemp = df["meantemp"].to_numpy(dtype=np.float64)
+    # Always bottleneck: pandas' rolling mean differs in the last digits, and
+    # Silver must not depend on which library happens to be installed
+    df["meantemp_rolling_7d"] = bn.move_mean(meantemp, window=7, min_count=1)
+    df["meantemp_lag_1"] = _lag_bfilled(meantemp, 1)
+    df["meantemp_lag_7"] = _lag_bfilled(meantemp, 7)
     df["day_of_year"] = pd.to_datetime(df[date_col]).dt.dayofyear
 
-    df["meantemp_lag_1"] = df["meantemp_lag_1"].bfill()
-    df["meantemp_lag_7"] = df["meantemp_lag_7"].bfill()
-
     return df
 
 
 def main() -> None:
     """Run validation, cleaning, and enrichment pipeline."""
-    bronze_path = Path(__file__).resolve().parent.parent / BRONZE_PATH
+    project_root = Path(__file__).resolve().parent.parent
+
+    bronze_path = project_root / BRONZE_PATH
     if not bronze_path.exists():
         logger.error("Bronze file not found: %s", bronze_path)
         sys.exit(1)
 
-    silver_csv = Path(__file__).resolve().parent.parent / SILVER_CSV_PATH
-    silver_report = Path(__file__).resolve().parent.parent / SILVER_REPORT_PATH
+    silver_csv = project_root / SILVER_CSV_PATH
+    silver_report = project_root / SILVER_REPORT_PATH
     silver_csv.parent.mkdir(parents=True, exist_ok=True)
 
     report: dict = {}
@@ -256,8 +303,7 @@ def main() -> None:
         logger.error("Validation failed (hard-fail). Exiting.")
         report["validation_passed"] = False
         silver_report.parent.mkdir(parents=True, exist_ok=True)
-        with open(silver_report, "w") as f:
-            json.dump(report, f, indent=2)
+        write_json(silver_report, report)
         sys.exit(1)
 
     df_clean = clean_data(df, date_col, report)
@@ -274,8 +320,7 @@ def main() -> None:
     df_clean.to_csv(silver_csv, index=False)
     logger.info("Wrote silver data to %s (%d rows)", silver_csv, len(df_clean))
 
-    with open(silver_report, "w") as f:
-        json.dump(report, f, indent=2)
+    write_json(silver_report, report)
     logger.info("Wrote validation report to %s", silver_report)
 
 
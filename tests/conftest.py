@@ -0,0 +1,208 @@
+"""
+Shared fixtures for the data quality tests.
+
+Layer artifacts are read once per session; tests only read the returned
+DataFrames and reports, never mutate them.
+"""
+
+import importlib.util
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from layers import (
+    BRONZE_CSV,
+    GOLD_CSV,
+    GOLD_REPORT,
+    SILVER_CSV,
+    SILVER_REPORT,
+    VALUE_RANGES,
+)
+
+
+# Derived columns the tests only check for presence; parsed as float32 to halve
+# their footprint. Columns compared against bounds or for equality (VALUE_RANGES
+# and target) stay float64, since float32 would round e.g. 1100.00003 to 1100.0.
+# Every column is still loaded so schema checks see the real layout.
+FLOAT32_COLS = ["meantemp_rolling_7d", "meantemp_lag_1", "meantemp_lag_7"]
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# Bump when _parse_csv changes the parsed dtypes, to invalidate cached frames
+_CACHE_VERSION = 4
+
+
+def _parse_csv(csv_path: Path, arrow_backed: bool = False, raw_dates: bool = False) -> pd.DataFrame:
+    """Parse a layer CSV, with pyarrow's multithreaded reader when available.
+
+    With arrow_backed, columns keep Arrow storage (pd.ArrowDtype) instead of
+    being converted to NumPy. With raw_dates (the unvalidated Bronze layer),
+    'date' is read as text and coerced like validate.load_bronze, so malformed
+    values become NaT instead of failing the parse.
+    """
+    if not HAS_PYARROW:
+        df = pd.read_csv(
+            csv_path,
+            parse_dates=None if raw_dates else ["date"],
+            dtype={c: "float32" for c in FLOAT32_COLS},
+            memory_map=True,
+            low_memory=False,
+        )
+    else:
+        import pyarrow as pa
+        from pyarrow import csv as pac
+
+        date_type = pa.string() if raw_dates else pa.timestamp("ns")
+        # Parse straight from the page cache rather than copying into a read buffer
+        with pa.memory_map(str(csv_path)) as source:
+            table = pac.read_csv(
+                source,
+                convert_options=pac.ConvertOptions(
+                    column_types={"date": date_type}
+                    | {c: pa.float32() for c in FLOAT32_COLS},
+                    timestamp_parsers=["%Y-%m-%d"],
+                ),
+            )
+        types_mapper = pd.ArrowDtype if arrow_backed else None
+        df = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=types_mapper)
+    if raw_dates:
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
+def _read_layer(
+    request, csv_path: Path, arrow_backed: bool = False, raw_dates: bool = False
+) -> pd.DataFrame:
+    """Read a layer CSV, reusing a Parquet copy in the pytest cache while the CSV is unchanged."""
+    cache = getattr(request.config, "cache", None)
+    if not HAS_PYARROW or cache is None:
+        return _parse_csv(csv_path, arrow_backed, raw_dates)
+
+    # Key on exact mtime and size: dvc checkout can restore an older mtime
+    stat = csv_path.stat()
+    cache_dir = cache.mkdir("layers")
+    key = f"v{_CACHE_VERSION}-{stat.st_mtime_ns}-{stat.st_size}"
+    cached = cache_dir / f"{csv_path.stem}-{key}.parquet"
+    if cached.exists():
+        if arrow_backed:
+            return pd.read_parquet(cached, engine="pyarrow", dtype_backend="pyarrow")
+        return pd.read_parquet(cached, engine="pyarrow")
+
+    df = _parse_csv(csv_path, arrow_backed, raw_dates)
+    # xdist workers may race here: write privately, then rename into place
+    tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp, engine="pyarrow", index=False)
+    os.replace(tmp, cached)
+    for stale in cache_dir.glob(f"{csv_path.stem}-*.parquet"):
+        if stale != cached:
+            stale.unlink(missing_ok=True)
+    return df
+
+
+@lru_cache(maxsize=8)
+def _load_json(path_str: str, mtime_ns: int):
+    """Parse a JSON report; mtime_ns is part of the cache key so rewrites are re-read."""
+    with open(path_str) as f:
+        return json.load(f)
+
+
+# Artifact behind each data fixture; tests requesting a missing one are
+# skipped once at collection instead of per test during fixture setup
+_FIXTURE_ARTIFACTS = {
+    "bronze": BRONZE_CSV,
+    "silver": SILVER_CSV,
+    "silver_arr": SILVER_CSV,
+    "gold": GOLD_CSV,
+    "gold_row_count": GOLD_CSV,
+    "silver_report": SILVER_REPORT,
+    "gold_report": GOLD_REPORT,
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    missing = {name: path for name, path in _FIXTURE_ARTIFACTS.items() if not path.exists()}
+    if not missing:
+        return
+    for item in items:
+        absent = [missing[name] for name in getattr(item, "fixturenames", ()) if name in missing]
+        if absent:
+            item.add_marker(pytest.mark.skip(reason=f"{absent[0].name} not yet produced"))
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def bronze(request):
+    pytest.importorskip("pandas")
+    if not BRONZE_CSV.exists():
+        pytest.skip("Bronze data not yet produced")
+    return _read_layer(request, BRONZE_CSV, raw_dates=True)
+
+
+@pytest.fixture(scope="session")
+def silver(request):
+    pytest.importorskip("pandas")
+    if not SILVER_CSV.exists():
+        pytest.skip("Silver data not yet produced")
+    return _read_layer(request, SILVER_CSV, arrow_backed=True)
+
+
+@pytest.fixture(scope="session")
+def gold(request):
+    pytest.importorskip("pandas")
+    if not GOLD_CSV.exists():
+        pytest.skip("Gold data not yet produced")
+    return _read_layer(request, GOLD_CSV, arrow_backed=True)
+
+
+@pytest.fixture(scope="session")
+def gold_row_count():
+    """Number of data rows in gold.csv, reading only the date column as text.
+
+    Blank lines are skipped, matching the row count of the parsed gold frame.
+    """
+    if not GOLD_CSV.exists():
+        pytest.skip("Gold data not yet produced")
+    if not HAS_PYARROW:
+        return len(pd.read_csv(GOLD_CSV, usecols=["date"], dtype=str))
+    import pyarrow as pa
+    from pyarrow import csv as pac
+
+    with pa.memory_map(str(GOLD_CSV)) as source:
+        table = pac.read_csv(
+            source,
+            convert_options=pac.ConvertOptions(
+                include_columns=["date"], column_types={"date": pa.string()}
+            ),
+        )
+    return table.num_rows
+
+
+@pytest.fixture(scope="session")
+def silver_arr(silver):
+    """Silver as contiguous arrays: the float64 VALUE_RANGES columns stacked in
+    VALUE_RANGES order as a (rows, k) 'ranges' block, plus int64 'date_ns'."""
+    arrays = {
+        "ranges": silver[list(VALUE_RANGES)].to_numpy(dtype="float64", na_value=np.nan),
+    }
+    arrays["date_ns"] = silver["date"].to_numpy().astype("datetime64[ns]", copy=False).view("i8")
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def silver_report():
+    if not SILVER_REPORT.exists():
+        pytest.skip("Silver validation report not yet produced")
+    return _load_json(str(SILVER_REPORT), SILVER_REPORT.stat().st_mtime_ns)
+
+
+@pytest.fixture(scope="session")
+def gold_report():
+    if not GOLD_REPORT.exists():
+        pytest.skip("Gold report not yet produced")
+    return _load_json(str(GOLD_REPORT), GOLD_REPORT.stat().st_mtime_ns)
@@ -0,0 +1,18 @@
+"""Layer artifact paths and value ranges shared by conftest and the tests."""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BRONZE_CSV = PROJECT_ROOT / "data" / "bronze" / "bronze.csv"
+INGESTED_LOG = PROJECT_ROOT / "data" / "bronze" / "ingested_batches.json"
+SILVER_CSV = PROJECT_ROOT / "data" / "silver" / "silver.csv"
+SILVER_REPORT = PROJECT_ROOT / "data" / "silver" / "validation_report.json"
+GOLD_CSV = PROJECT_ROOT / "data" / "gold" / "gold.csv"
+GOLD_REPORT = PROJECT_ROOT / "data" / "gold" / "gold_report.json"
+
+VALUE_RANGES = {
+    "meantemp": (-20, 55),
+    "humidity": (0, 100),
+    "wind_speed": (0, 50),
+    "meanpressure": (900, 1100),
+}
@@ -6,68 +6,16 @@ Run after each pipeline execution (dvc repro) to verify data integrity:
 """
 
 import json
-from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-BRONZE_CSV = PROJECT_ROOT / "data" / "bronze" / "bronze.csv"
-INGESTED_LOG = PROJECT_ROOT / "data" / "bronze" / "ingested_batches.json"
-SILVER_CSV = PROJECT_ROOT / "data" / "silver" / "silver.csv"
-SILVER_REPORT = PROJECT_ROOT / "data" / "silver" / "validation_report.json"
-GOLD_CSV = PROJECT_ROOT / "data" / "gold" / "gold.csv"
-GOLD_REPORT = PROJECT_ROOT / "data" / "gold" / "gold_report.json"
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; fall back to plain NumPy comparisons
+    ne = None
 
-VALUE_RANGES = {
-    "meantemp": (-20, 55),
-    "humidity": (0, 100),
-    "wind_speed": (0, 50),
-    "meanpressure": (900, 1100),
-}
-
-
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-@pytest.fixture(scope="module")
-def bronze():
-    pytest.importorskip("pandas")
-    if not BRONZE_CSV.exists():
-        pytest.skip("Bronze data not yet produced")
-    return pd.read_csv(BRONZE_CSV, parse_dates=["date"])
-
-
-@pytest.fixture(scope="module")
-def silver():
-    pytest.importorskip("pandas")
-    if not SILVER_CSV.exists():
-        pytest.skip("Silver data not yet produced")
-    return pd.read_csv(SILVER_CSV, parse_dates=["date"])
-
-
-@pytest.fixture(scope="module")
-def gold():
-    pytest.importorskip("pandas")
-    if not GOLD_CSV.exists():
-        pytest.skip("Gold data not yet produced")
-    return pd.read_csv(GOLD_CSV, parse_dates=["date"])
-
-
-@pytest.fixture(scope="module")
-def silver_report():
-    if not SILVER_REPORT.exists():
-        pytest.skip("Silver validation report not yet produced")
-    with open(SILVER_REPORT) as f:
-        return json.load(f)
-
-
-@pytest.fixture(scope="module")
-def gold_report():
-    if not GOLD_REPORT.exists():
-        pytest.skip("Gold report not yet produced")
-    with open(GOLD_REPORT) as f:
-        return json.load(f)
+from layers import BRONZE_CSV, INGESTED_LOG, VALUE_RANGES
 
 
 # ---------------------------------------------------------------------------
@@ -78,8 +26,9 @@ class TestBronze:
         assert BRONZE_CSV.exists(), "bronze.csv must exist after ingestion"
 
     def test_expected_columns(self, bronze):
-        required = {"date", "meantemp", "humidity", "wind_speed", "meanpressure"}
-        assert required.issubset(set(bronze.columns))
+        required = pd.Index(["date", "meantemp", "humidity", "wind_speed", "meanpressure"])
+        missing = required.difference(bronze.columns)
+        assert missing.empty, f"Missing columns: {missing.tolist()}"
 
     def test_not_empty(self, bronze):
         assert len(bronze) > 0
@@ -89,8 +38,17 @@ class TestBronze:
         assert INGESTED_LOG.exists(), "ingested_batches.json must exist"
         with open(INGESTED_LOG) as f:
             ingested = json.load(f)
-        assert len(ingested) > 0, "At least one batch should be recorded"
-        assert all(1 <= b <= 5 for b in ingested), "Batch IDs must be in 1..5"
+        # No dtype: coercing would let "3" or 1.7 through, which would break
+        # ingest.py's 'batch_id in ingested' idempotency check
+        batch_ids = np.asarray(ingested)
+        assert batch_ids.size > 0, "At least one batch should be recorded"
+        assert np.issubdtype(batch_ids.dtype, np.integer), (
+            f"Batch IDs must be integers, got {ingested}"
+        )
+        out_of_range = (batch_ids < 1) | (batch_ids > 5)
+        assert not out_of_range.any(), (
+            f"Batch IDs must be in 1..5, got {batch_ids[out_of_range].tolist()}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -98,37 +56,64 @@ class TestBronze:
 # ---------------------------------------------------------------------------
 class TestSilver:
     def test_no_duplicate_dates(self, silver):
-        dups = silver["date"].duplicated()
-        assert dups.sum() == 0, f"Silver has {dups.sum()} duplicate dates"
+        dates = pd.Index(silver["date"])
+        # has_duplicates is cached on the Index; duplicated() only runs on failure
+        assert not dates.has_duplicates, (
+            f"Silver has {dates.duplicated().sum()} duplicate dates: "
+            f"{dates[dates.duplicated()][:5].tolist()}"
+        )
 
     def test_time_index_continuity(self, silver):
         """Every calendar day between min and max date must be present."""
-        dates = silver["date"].sort_values()
-        full_range = pd.date_range(start=dates.min(), end=dates.max(), freq="D")
-        missing = set(full_range) - set(dates)
-        assert len(missing) == 0, f"Silver is missing {len(missing)} dates: {sorted(missing)[:5]}..."
-
-    def test_dates_sorted(self, silver):
-        assert silver["date"].is_monotonic_increasing, "Silver dates must be sorted ascending"
-
-    def test_no_nan_after_imputation(self, silver):
-        core_cols = ["meantemp", "humidity", "wind_speed", "meanpressure"]
-        for col in core_cols:
-            nans = silver[col].isna().sum()
-            assert nans == 0, f"Silver column '{col}' has {nans} NaN values after imputation"
-
-    def test_value_ranges(self, silver):
-        for col, (lo, hi) in VALUE_RANGES.items():
-            below = (silver[col] < lo).sum()
-            above = (silver[col] > hi).sum()
-            assert below == 0, f"{col}: {below} values below {lo}"
-            assert above == 0, f"{col}: {above} values above {hi}"
+        dates = pd.DatetimeIndex(silver["date"])
+        dmin, dmax = dates.min(), dates.max()
+        # As many unique, non-NaT days as the span covers means no day can be missing
+        # (min/max skip NaT, so a blank date would otherwise look like a full span)
+        if (
+            not dates.hasnans
+            and not dates.has_duplicates
+            and len(dates) == (dmax - dmin).days + 1
+        ):
+            return
+        full_range = pd.date_range(start=dmin, end=dmax, freq="D")
+        missing = full_range.difference(dates)
+        assert missing.empty, f"Silver is missing {len(missing)} dates: {missing[:5].tolist()}..."
+
+    def test_dates_sorted(self, silver_arr):
+        assert (np.diff(silver_arr["date_ns"]) > 0).all(), "Silver dates must be strictly increasing"
+
+    def test_no_nan_after_imputation(self, silver_arr):
+        # One reduction over the (rows, k) block, then paired with the column names
+        nans = dict(zip(VALUE_RANGES, np.isnan(silver_arr["ranges"]).sum(axis=0).tolist()))
+        bad = {c: n for c, n in nans.items() if n > 0}
+        assert not bad, f"Silver columns have NaN values after imputation: {bad}"
+
+    def test_value_ranges(self, silver_arr):
+        block = silver_arr["ranges"]
+        lo = np.array([lo for lo, _ in VALUE_RANGES.values()], dtype=np.float64)
+        hi = np.array([hi for _, hi in VALUE_RANGES.values()], dtype=np.float64)
+        # One mask over the (rows, k) block with the bounds broadcast per column
+        if ne is not None:
+            bad = ne.evaluate("(block < lo) | (block > hi)")
+        else:
+            bad = (block < lo) | (block > hi)
+        if bad.any():
+            failures = []
+            for j, (col, (col_lo, col_hi)) in enumerate(VALUE_RANGES.items()):
+                if bad[:, j].any():
+                    row = int(np.argmax(bad[:, j]))
+                    failures.append(
+                        f"{col}: {int(bad[:, j].sum())} values outside [{col_lo}, {col_hi}] "
+                        f"(first at row {row}: {block[row, j]})"
+                    )
+            raise AssertionError("; ".join(failures))
 
     def test_derived_features_present(self, silver):
-        expected = {"meantemp_rolling_7d", "meantemp_lag_1", "meantemp_lag_7", "day_of_year"}
-        assert expected.issubset(set(silver.columns)), (
-            f"Missing derived features: {expected - set(silver.columns)}"
+        expected = pd.Index(
+            ["meantemp_rolling_7d", "meantemp_lag_1", "meantemp_lag_7", "day_of_year"]
         )
+        missing = expected.difference(silver.columns)
+        assert missing.empty, f"Missing derived features: {missing.tolist()}"
 
     def test_validation_report_passed(self, silver_report):
         assert silver_report["validation_passed"] is True
@@ -139,8 +124,10 @@ class TestSilver:
 # ---------------------------------------------------------------------------
 class TestGold:
     def test_no_nans(self, gold):
-        total = gold.isna().sum().sum()
-        assert total == 0, f"Gold dataset has {total} NaN values"
+        # Arrow-backed isna() is a cheap null-bitmap read; no float copy of the frame
+        has_nans = gold.isna().to_numpy().any()
+        # The message (and its full count) is only evaluated on failure
+        assert not has_nans, f"Gold dataset has {gold.isna().sum().sum()} NaN values"
 
     def test_not_empty(self, gold):
         assert len(gold) > 0
@@ -150,24 +137,20 @@ class TestGold:
 
     def test_target_is_next_day_meantemp(self, gold):
         """Verify target == next row's meantemp (except the last row which is dropped)."""
-        shifted = gold["meantemp"].shift(-1)
-        valid = shifted.dropna().index
-        pd.testing.assert_series_equal(
-            gold.loc[valid, "target"].reset_index(drop=True),
-            shifted.dropna().reset_index(drop=True),
-            check_names=False,
-        )
+        target = gold["target"].to_numpy()
+        meantemp = gold["meantemp"].to_numpy()
+        assert np.array_equal(target[:-1], meantemp[1:]), "target != next-day meantemp"
 
     def test_expected_feature_columns(self, gold, gold_report):
-        for col in gold_report["feature_columns"]:
-            assert col in gold.columns, f"Feature '{col}' listed in report but missing from data"
+        missing = pd.Index(gold_report["feature_columns"]).difference(gold.columns)
+        assert missing.empty, f"Features listed in report but missing from data: {missing.tolist()}"
 
     def test_date_range_nontrivial(self, gold):
         date_range = gold["date"].max() - gold["date"].min()
         assert date_range.days >= 30, "Gold date range must span at least 30 days"
 
-    def test_gold_report_consistency(self, gold, gold_report):
-        assert gold_report["rows"] == len(gold)
+    def test_gold_report_consistency(self, gold_row_count, gold_report):
+        assert gold_report["rows"] == gold_row_count
         assert gold_report["target_column"] == "target"
 
 